@@ -48,12 +48,25 @@ README.md file in the project root.
 """
 
 import argparse
+import ast
+import atexit
+import codecs
+import contextlib
+import errno
+import functools
 import subprocess
 import os
 import sys
 import logging
-import re
+import logging.handlers
+import queue
+import importlib.util
+import string
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from pathlib import Path
 
 # ------------------------------------------------------------------------------
 # SCRIPT CONFIGURATION
@@ -65,23 +78,25 @@ from datetime import datetime
 # Most operational configurations (API keys, specific URLs, parsing rules)
 # should be managed in files within the './config/' directory.
 
-PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = Path(__file__).resolve().parent
 # Assumes 'main.py' is in the project's root directory.
 
-INVESTIGATIONS_DIR = os.path.join(PROJECT_ROOT, "investigations")
+INVESTIGATIONS_DIR = PROJECT_ROOT / "investigations"
 # Directory containing individual case folders.
 
-SCRIPTS_DIR = os.path.join(PROJECT_ROOT, "scripts")
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
 # Directory containing all the modular Python/shell scripts for each task.
 
-CONFIG_DIR = os.path.join(PROJECT_ROOT, "config")
+CONFIG_DIR = PROJECT_ROOT / "config"
 # Directory for configuration files (e.g., API settings, parser rules).
 
-LOGS_DIR = os.path.join(PROJECT_ROOT, "logs")
+LOGS_DIR = PROJECT_ROOT / "logs"
 # Directory where log files will be stored.
 
 DEFAULT_SCRIPT_TIMEOUT = 7200 # Default timeout for sub-scripts in seconds (e.g., 2 hours)
 
+DEFAULT_MAX_PARALLEL_SCRIPTS = 4 # Upper bound on sub-scripts launched concurrently within a stage
+
 # ------------------------------------------------------------------------------
 # CUSTOM EXCEPTIONS
 # ------------------------------------------------------------------------------
@@ -109,22 +124,355 @@ class InvalidCaseNameError(OrchestratorError):
 # LOGGING SETUP
 # ------------------------------------------------------------------------------
 LOG_FORMAT = '%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
-os.makedirs(LOGS_DIR, exist_ok=True) # Create logs directory if it doesn't exist
-LOG_FILE = os.path.join(LOGS_DIR, f"orchestrator_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
-
-logging.basicConfig(
-    level=logging.INFO, # Set to logging.DEBUG for more verbose output
-    format=LOG_FORMAT,
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler(sys.stdout)  # Also print to console
-    ]
+LOGS_DIR.mkdir(parents=True, exist_ok=True) # Create logs directory if it doesn't exist
+LOG_FILE = LOGS_DIR / f"orchestrator_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+
+LOG_FILE_BUFFER_SIZE = 64 * 1024 # Bytes buffered in user space before the log file is written
+LOG_BATCH_CAPACITY = 512 # Records held in memory before they are written to the log file
+LOG_FLUSH_INTERVAL = 2.0 # Maximum seconds a buffered record waits before reaching the log file
+LOG_IO_URING_ENTRIES = 256 # Submission queue size for --io-uring-logging
+
+
+def _flush_failure_record(handler):
+    """Builds a LogRecord describing a failed flush, for passing to handler.handleError()."""
+    return logging.makeLogRecord({
+        "msg": "Failed to flush log handler %r",
+        "args": (handler,),
+    })
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that writes through a large user-space buffer instead of
+    flushing the stream after every record. The buffer is written out when
+    flush() is called explicitly (see BatchingMemoryHandler) or on close().
+    """
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_FILE_BUFFER_SIZE, encoding=self.encoding)
+
+    def emit(self, record):
+        try:
+            if self.stream is None: # Opened lazily on first write (delay=True)
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        # StreamHandler.flush lets write errors (disk full, EIO) propagate, which
+        # would end the QueueListener thread; report them like emit() does instead.
+        try:
+            super().flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(_flush_failure_record(self))
+
+
+class BatchingMemoryHandler(logging.handlers.MemoryHandler):
+    """
+    MemoryHandler that also flushes its target after handing over a batch,
+    so each batch of records results in a single write to the log file.
+    """
+
+    def flush(self):
+        self.acquire()
+        try:
+            super().flush()
+            if self.target:
+                self.target.flush()
+        finally:
+            self.release()
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted '%(asctime)s' string for all records
+    created within the same second, instead of calling time.localtime() and
+    strftime() for every record. The cache is kept per thread.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._time_cache = threading.local()
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt: # Custom date formats are uncommon; use the standard path
+            return super().formatTime(record, datefmt)
+        seconds = int(record.created)
+        cache = self._time_cache
+        if getattr(cache, "seconds", None) != seconds:
+            cache.seconds = seconds
+            cache.text = time.strftime(self.default_time_format, self.converter(seconds))
+        return "%s,%03d" % (cache.text, record.msecs)
+
+
+class IoUringFileHandler(logging.Handler):
+    """
+    Log file handler that submits batched writes through io_uring (Linux only,
+    requires the optional 'liburing' package). Formatted records accumulate in
+    a buffer of LOG_FILE_BUFFER_SIZE bytes and each full buffer becomes one
+    write request. Every request targets an explicit file offset, so requests
+    may complete in any order without reordering the log. flush() waits for
+    all submitted writes to complete.
+
+    Raises ImportError or OSError from the constructor when io_uring cannot
+    be used, so the caller can keep the regular file handler.
+    """
+
+    terminator = '\n'
+
+    def __init__(self, filename, entries=LOG_IO_URING_ENTRIES):
+        import liburing # Optional dependency, only needed for --io-uring-logging
+        super().__init__()
+        self._liburing = liburing
+        self.baseFilename = os.path.abspath(filename)
+        self._entries = entries
+        self._cqe = liburing.Cqe()
+        try:
+            # A kernel thread polls the submission queue, so most writes need no syscall.
+            self._ring = liburing.Ring()
+            liburing.io_uring_queue_init(entries, self._ring, liburing.IORING_SETUP_SQPOLL)
+        except OSError: # SQPOLL needs extra privileges on older kernels
+            self._ring = liburing.Ring()
+            liburing.io_uring_queue_init(entries, self._ring)
+        try:
+            self._fd = os.open(self.baseFilename, os.O_WRONLY | os.O_CREAT, 0o644)
+            self._offset = os.fstat(self._fd).st_size # Append to any existing content
+        except OSError:
+            liburing.io_uring_queue_exit(self._ring)
+            raise
+        self._buffer = bytearray()
+        self._in_flight = {} # Request id -> (offset, data); data must stay alive until completion
+        self._orphaned = {} # Requests whose submit call failed but that may still complete
+        self._next_request_id = 0
+
+    def emit(self, record):
+        try:
+            self._buffer += (self.format(record) + self.terminator).encode("utf-8")
+            if len(self._buffer) >= LOG_FILE_BUFFER_SIZE:
+                self._submit_buffer()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _submit_buffer(self):
+        if not self._buffer:
+            return
+        data = bytes(self._buffer)
+        self._submit_write(self._offset, data)
+        # Only drop the records once the write is queued; if submission raised,
+        # they stay buffered and are retried (at the same offset) next time.
+        del self._buffer[:len(data)]
+        self._offset += len(data)
+
+    def _submit_write(self, offset, data):
+        liburing = self._liburing
+        if len(self._in_flight) >= self._entries:
+            self._reap(wait=True)
+        sqe = liburing.io_uring_get_sqe(self._ring)
+        if sqe is None:
+            raise BlockingIOError(errno.EBUSY, "io_uring submission queue is full")
+        request_id = self._next_request_id
+        self._next_request_id += 1
+        liburing.io_uring_prep_write(sqe, self._fd, data, offset)
+        liburing.io_uring_sqe_set_data64(sqe, request_id)
+        self._in_flight[request_id] = (offset, data)
+        try:
+            liburing.io_uring_submit(self._ring)
+        except BaseException:
+            # The prepared entry may still go out with a later submit; keep its
+            # data alive until then. Repeating the same bytes at the same offset
+            # is harmless, so the caller can simply retry.
+            self._orphaned[request_id] = self._in_flight.pop(request_id)
+            raise
+        self._reap(wait=False)
+
+    def _reap(self, wait):
+        """Processes completions; with wait=True, blocks until no writes are in flight."""
+        liburing = self._liburing
+        while self._in_flight:
+            try:
+                if wait:
+                    liburing.trap_error(liburing.io_uring_wait_cqe(self._ring, self._cqe))
+                else:
+                    liburing.trap_error(liburing.io_uring_peek_cqe(self._ring, self._cqe))
+            except BlockingIOError: # Nothing has completed yet
+                return
+            entry = self._cqe[0]
+            request_id = entry.user_data
+            try:
+                result = entry.res
+            except OSError as e: # The binding raises for negative (errno) results
+                result = -e.errno
+            liburing.io_uring_cqe_seen(self._ring, entry)
+            if request_id in self._orphaned: # Its data has been resubmitted since
+                del self._orphaned[request_id]
+                continue
+            offset, data = self._in_flight.pop(request_id)
+            if result in (-errno.EAGAIN, -errno.EINTR):
+                self._submit_write(offset, data)
+            elif result < 0:
+                self._report_write_error(-result, offset, data)
+            elif result < len(data): # Short write; resubmit the remainder
+                self._submit_write(offset + result, data[result:])
+
+    def _report_write_error(self, error_number, offset, data):
+        """
+        Reports a failed write through handleError() instead of raising, which
+        would end the QueueListener thread. The chunk is dropped.
+        """
+        record = logging.makeLogRecord({
+            "msg": "Failed to write %d bytes to %s at offset %d",
+            "args": (len(data), self.baseFilename, offset),
+        })
+        try:
+            raise OSError(error_number, os.strerror(error_number), self.baseFilename)
+        except OSError:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self._fd is not None:
+                self._submit_buffer()
+                self._reap(wait=True)
+        except RecursionError:
+            raise
+        except Exception: # Report like BufferedFileHandler.flush does; never raise
+            self.handleError(_flush_failure_record(self))
+        finally:
+            self.release()
+
+    def close(self):
+        self.acquire()
+        try:
+            if self._fd is not None:
+                try:
+                    self.flush()
+                finally:
+                    self._liburing.io_uring_queue_exit(self._ring)
+                    os.close(self._fd)
+                    self._fd = None
+        finally:
+            self.release()
+        super().close()
+
+
+def _periodic_log_flush(handler, stop_event, interval):
+    """Flushes handler every interval seconds until stop_event is set, bounding log latency."""
+    while not stop_event.wait(interval):
+        try:
+            handler.flush()
+        except Exception: # Keep flushing on later intervals
+            handler.handleError(_flush_failure_record(handler))
+
+
+# Log records are handed to a queue on the calling thread and written to the
+# file and console by a single background listener thread, so that logging
+# from stage loops and output relay threads never blocks on disk/console I/O.
+# File writes are further batched in memory and flushed on errors, when the
+# batch is full, or every LOG_FLUSH_INTERVAL seconds.
+_log_formatter = CachedTimeFormatter(LOG_FORMAT)
+_file_handler = BufferedFileHandler(LOG_FILE, delay=True)
+_file_handler.setFormatter(_log_formatter)
+_batched_file_handler = BatchingMemoryHandler(
+    capacity=LOG_BATCH_CAPACITY, flushLevel=logging.ERROR, target=_file_handler, flushOnClose=True
+)
+_console_handler = logging.StreamHandler(sys.stdout) # Also print to console
+_console_handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO) # Set to logging.DEBUG for more verbose output
+_root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _batched_file_handler, _console_handler, respect_handler_level=True
 )
-logging.info(f"Orchestrator script started. Logging to: {LOG_FILE}")
-logging.info(f"Project Root: {PROJECT_ROOT}")
+_log_listener.start()
+
+_log_flush_stop = threading.Event()
+threading.Thread(
+    target=_periodic_log_flush, args=(_batched_file_handler, _log_flush_stop, LOG_FLUSH_INTERVAL), daemon=True
+).start()
+
+
+def _enable_io_uring_logging():
+    """
+    Switches log file output from the buffered FileHandler to an IoUringFileHandler.
+    Returns False, keeping the current handler, if io_uring is not available.
+    """
+    _batched_file_handler.acquire()
+    try:
+        _batched_file_handler.flush() # Everything so far reaches the file before the switch
+        try:
+            io_uring_handler = IoUringFileHandler(LOG_FILE)
+        except (ImportError, OSError) as e:
+            logging.warning("io_uring logging unavailable (%s: %s); using buffered file logging.", type(e).__name__, e)
+            return False
+        io_uring_handler.setFormatter(_log_formatter)
+        _batched_file_handler.setTarget(io_uring_handler)
+    finally:
+        _batched_file_handler.release()
+    _file_handler.close()
+    return True
+
+
+def _shutdown_logging():
+    """Drains the log queue and writes any buffered records to disk on interpreter exit."""
+    log_file_handler = _batched_file_handler.target # close() below clears the target
+    try:
+        _log_listener.stop()
+    finally:
+        _log_flush_stop.set()
+        try:
+            _batched_file_handler.close()
+        finally:
+            log_file_handler.close()
+
+atexit.register(_shutdown_logging)
+
+logging.info("Orchestrator script started. Logging to: %s", LOG_FILE)
+logging.info("Project Root: %s", PROJECT_ROOT)
 
 
 # --- Helper Functions ---
+_CASE_NAME_ALLOWED_CHARS = frozenset(string.ascii_letters + string.digits + "_.-")
+# Characters permitted in a case name; checked with a single set comparison instead of a regex.
+
+def _walk_scripts(directory, relative_prefix=""):
+    """
+    Recursively yields (relative_path, full_path) for every file under directory.
+    Relative paths use '/' separators, matching how scripts are named in the stages.
+    os.scandir is used so file types come from the directory entries without extra stat calls.
+    Like os.walk, symlinked directories are not followed, and directories that
+    cannot be read are skipped rather than aborting startup.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            subdirectories = []
+            for entry in entries:
+                relative_path = relative_prefix + entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append((entry.path, relative_path + "/"))
+                    elif entry.is_file():
+                        yield relative_path, entry.path
+                except OSError: # e.g. a dangling or looping symlink
+                    continue
+    except OSError: # Missing or unreadable directory
+        return
+    for subdirectory, subdirectory_prefix in subdirectories:
+        yield from _walk_scripts(subdirectory, subdirectory_prefix)
+
+_SCRIPT_TABLE = dict(_walk_scripts(SCRIPTS_DIR))
+# Scripts available under SCRIPTS_DIR, resolved once at startup. Scripts added
+# while the orchestrator is running are not picked up.
+
 def validate_case_name(case_name):
     """
     Validates the case name to prevent path traversal and ensure it's a simple name.
@@ -132,18 +480,27 @@ def validate_case_name(case_name):
     """
     if not case_name:
         raise InvalidCaseNameError("Case name cannot be empty.")
-    # Regex to allow alphanumeric, underscore, hyphen, period. Disallow path separators.
-    if not re.match(r"^[a-zA-Z0-9_.-]+$", case_name):
+    # Allow only alphanumeric, underscore, hyphen, period. Disallow path separators.
+    if not _CASE_NAME_ALLOWED_CHARS.issuperset(case_name):
         raise InvalidCaseNameError(
             f"Invalid case name: '{case_name}'. "
             "Allowed characters are alphanumeric, underscore, hyphen, period. "
             "Path separators (/, \\) are not allowed."
         )
-    if ".." in case_name: # Double check for ".." just in case regex misses complex cases
+    if ".." in case_name: # Double check for ".." since periods are allowed individually
         raise InvalidCaseNameError(f"Invalid case name: '{case_name}'. Path traversal '..' is not allowed.")
     return True
 
 
+@functools.lru_cache(maxsize=64)
+def _investigation_exists(case_name):
+    """
+    Cached check for the investigation directory, so running several stages in
+    one invocation stats it only once. Call _investigation_exists.cache_clear()
+    whenever investigation directories are created.
+    """
+    return (INVESTIGATIONS_DIR / case_name).is_dir()
+
 def validate_investigation_exists(case_name):
     """
     Checks if the specified investigation directory exists.
@@ -155,79 +512,391 @@ def validate_investigation_exists(case_name):
         logging.error(str(e))
         return False
 
-    investigation_path = os.path.join(INVESTIGATIONS_DIR, case_name)
-    if not os.path.isdir(investigation_path):
-        logging.error(f"Investigation directory not found: {investigation_path}")
-        logging.error(f"Please ensure a directory named '{case_name}' exists within '{INVESTIGATIONS_DIR}' or run the 'setup' stage.")
+    investigation_path = INVESTIGATIONS_DIR / case_name
+    if not _investigation_exists(case_name):
+        logging.error("Investigation directory not found: %s", investigation_path)
+        logging.error("Please ensure a directory named '%s' exists within '%s' or run the 'setup' stage.", case_name, INVESTIGATIONS_DIR)
         return False
-    logging.debug(f"Validated investigation directory: {investigation_path}")
+    logging.debug("Validated investigation directory: %s", investigation_path)
     return True
 
-def run_script(script_path_relative, case_name, script_timeout, *args):
+def _relay_stream(stream, level, label):
+    """
+    Reads a binary subprocess pipe line by line and logs each line at level.
+    Intended to run in its own thread so stdout and stderr are drained concurrently.
+    Lines are only decoded when the record will actually be logged; undecodable
+    bytes are replaced rather than stopping the relay (which would leave the
+    child blocked on a full pipe).
+    """
+    with stream:
+        for line in iter(stream.readline, b''):
+            if _root_logger.isEnabledFor(level):
+                logging.log(level, "%s %s", label, line.rstrip().decode("utf-8", errors="replace"))
+
+class _LogLineWriter:
+    """
+    Minimal text stream that logs each complete line written to it at level,
+    prefixed with label. A level of None discards the output.
+    """
+
+    def __init__(self, level, label):
+        self._level = level
+        self._label = label
+        self._partial = ""
+        self.buffer = _LogLineByteWriter(self) # What scripts get for sys.stdout.buffer
+
+    def write(self, text):
+        if self._level is not None:
+            lines = (self._partial + text).split("\n")
+            self._partial = lines.pop()
+            for line in lines:
+                logging.log(self._level, "%s %s", self._label, line.rstrip())
+        return len(text)
+
+    def flush(self):
+        if self._partial:
+            logging.log(self._level, "%s %s", self._label, self._partial.rstrip())
+            self._partial = ""
+
+    def writable(self):
+        return True
+
+    def isatty(self):
+        return False
+
+
+class _LogLineByteWriter:
+    """
+    Binary counterpart of _LogLineWriter, so bytes written to
+    sys.stdout.buffer / sys.stderr.buffer are logged like text output.
+    """
+
+    def __init__(self, text_writer):
+        self._text_writer = text_writer
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def write(self, data):
+        self._text_writer.write(self._decoder.decode(bytes(data)))
+        return len(data)
+
+    def flush(self):
+        self._text_writer.write(self._decoder.decode(b"", final=True))
+        self._text_writer.flush()
+
+    def writable(self):
+        return True
+
+    def isatty(self):
+        return False
+
+
+class _ThreadOutputRouter:
+    """
+    Stand-in for sys.stdout/sys.stderr that sends writes made by a thread
+    running an in-process script to that script's _LogLineWriter, and all
+    other writes to the original stream. Threads started by the script
+    itself are not routed.
+    """
+
+    def __init__(self, default_stream):
+        self._default_stream = default_stream
+        self._local = threading.local()
+
+    def _stream(self):
+        return getattr(self._local, "target", None) or self._default_stream
+
+    def write(self, text):
+        return self._stream().write(text)
+
+    def flush(self):
+        self._stream().flush()
+
+    @property
+    def buffer(self):
+        return self._stream().buffer
+
+    def __getattr__(self, name): # encoding, fileno(), ... of the real stream
+        return getattr(self._default_stream, name)
+
+    @contextlib.contextmanager
+    def routed_to(self, target):
+        previous = getattr(self._local, "target", None)
+        self._local.target = target
+        try:
+            yield
+        finally:
+            self._local.target = previous
+
+
+_in_process_setup_lock = threading.Lock()
+
+def _prepare_in_process_environment(script_dir):
+    """
+    Makes the interpreter look like the one a subprocess would get: stdout and
+    stderr can be routed per thread, the working directory is PROJECT_ROOT and
+    the script's own directory is importable. The cwd and sys.path changes are
+    process-wide; the orchestrator itself only uses absolute paths.
+    """
+    with _in_process_setup_lock:
+        if not isinstance(sys.stdout, _ThreadOutputRouter):
+            sys.stdout = _ThreadOutputRouter(sys.stdout)
+        if not isinstance(sys.stderr, _ThreadOutputRouter):
+            sys.stderr = _ThreadOutputRouter(sys.stderr)
+        if os.getcwd() != str(PROJECT_ROOT):
+            os.chdir(PROJECT_ROOT)
+        if script_dir not in sys.path:
+            sys.path.insert(0, script_dir)
+
+@contextlib.contextmanager
+def _route_script_output(stdout_writer, stderr_writer):
+    """Routes the current thread's sys.stdout/sys.stderr to the given writers."""
+    with sys.stdout.routed_to(stdout_writer), sys.stderr.routed_to(stderr_writer):
+        try:
+            yield
+        finally:
+            stdout_writer.buffer.flush() # Also flushes the text writer
+            stderr_writer.buffer.flush()
+
+def _defines_run_function(full_script_path):
+    """
+    Checks, without executing the script, whether it defines a module-level
+    'def run(...)'. Scripts that cannot be read or parsed return False and are
+    left to the subprocess path to report.
+    """
+    try:
+        tree = ast.parse(Path(full_script_path).read_bytes(), filename=full_script_path)
+    except (OSError, SyntaxError, ValueError):
+        return False
+    return any(isinstance(node, ast.FunctionDef) and node.name == "run" for node in tree.body)
+
+def _load_script_module(full_script_path, script_path_relative):
+    """
+    Imports a Python script from its file path as a module, without
+    registering it in sys.modules. Top-level code in the script runs here,
+    so scripts used in-process must guard their CLI entry point with
+    'if __name__ == "__main__":'.
+    """
+    module_name = "orchestrator_script_" + "".join(
+        c if c.isalnum() else "_" for c in script_path_relative[:-len(".py")]
+    )
+    try:
+        spec = importlib.util.spec_from_file_location(module_name, full_script_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except (Exception, SystemExit) as e: # e.g. an unguarded sys.exit() or parse_args() at top level
+        msg = f"Failed to import script '{script_path_relative}' for in-process execution: {type(e).__name__} - {e}"
+        logging.error(msg)
+        raise ScriptExecutionError(msg) from e
+    return module
+
+def _is_successful_result(outcome):
+    """
+    Interprets the outcome of an in-process run() like a process exit status.
+    A return value of None, True or 0 is success; False or any other value is
+    failure. SystemExit follows sys.exit() semantics (None or 0 is success).
+    """
+    if "exit_code" in outcome:
+        exit_code = outcome["exit_code"]
+        return exit_code is None or exit_code == 0
+    return_value = outcome.get("return_value")
+    if return_value is None or isinstance(return_value, bool):
+        return return_value is not False
+    return isinstance(return_value, int) and return_value == 0
+
+def _run_script_in_process(full_script_path, script_path_relative, case_name, script_timeout, args, stderr_level):
+    """
+    Imports the script and calls module.run(case_name, *args) in a worker
+    thread, enforcing script_timeout. Output written to sys.stdout/sys.stderr
+    while importing and running is logged like subprocess output (stderr at
+    stderr_level, or discarded if None).
+
+    Unlike a subprocess, a timed-out in-process script cannot be killed; the
+    worker is a daemon thread, so it is abandoned and does not block exit.
+    """
+    _prepare_in_process_environment(os.path.dirname(full_script_path))
+    output_label = f"[{script_path_relative} | {case_name}]"
+    stdout_writer = _LogLineWriter(logging.INFO, output_label)
+    stderr_writer = _LogLineWriter(stderr_level, output_label)
+
+    with _route_script_output(stdout_writer, stderr_writer):
+        module = _load_script_module(full_script_path, script_path_relative)
+
+    logging.info("Executing script in-process: %s (Case: %s, Args: %s, Timeout: %ds)", script_path_relative, case_name, list(args), script_timeout)
+    outcome = {}
+
+    def target():
+        with _route_script_output(stdout_writer, stderr_writer):
+            try:
+                outcome["return_value"] = module.run(case_name, *args)
+            except SystemExit as e:
+                outcome["exit_code"] = e.code
+            except BaseException as e:
+                outcome["error"] = e
+
+    worker = threading.Thread(target=target, name=f"script:{script_path_relative}", daemon=True)
+    worker.start()
+    worker.join(script_timeout)
+
+    if worker.is_alive():
+        msg = f"Script '{script_path_relative}' timed out for case '{case_name}'."
+        logging.error("Timeout (%ds) expired for in-process script '%s' for case '%s'. The worker thread has been abandoned.", script_timeout, script_path_relative, case_name)
+        raise ScriptExecutionError(msg)
+    if "error" in outcome:
+        e = outcome["error"]
+        msg = f"An unexpected error occurred while running '{script_path_relative}' for case '{case_name}': {type(e).__name__} - {e}"
+        logging.error(msg)
+        raise ScriptExecutionError(msg) from e
+
+    if not _is_successful_result(outcome):
+        result = outcome.get("exit_code", outcome.get("return_value"))
+        msg = f"Script '{script_path_relative}' failed for case '{case_name}' with return code {result!r}."
+        logging.error(msg)
+        raise ScriptExecutionError(msg)
+
+    logging.info("Script '%s' completed successfully for case '%s'.", script_path_relative, case_name)
+    return True
+
+def run_script(script_path_relative, case_name, script_timeout, *args,
+               in_process=False, merge_stderr=True, quiet_stderr_scripts=()):
     """
     Runs a specified script located within the SCRIPTS_DIR using subprocess.
     Passes the case_name as the first argument to the target script,
     followed by any additional arguments provided in *args.
 
+    When in_process is True, Python scripts that define a module-level
+    'run(case_name, *args) -> int' function are imported and called directly,
+    avoiding the cost of starting a new interpreter. The check for 'run()' is
+    made on the source, before the script is imported. Scripts without 'run()'
+    and non-Python scripts still go through subprocess. A script with 'run()'
+    that fails to import is reported as failed, not retried as a subprocess,
+    since its top-level code has already run once.
+
     Args:
         script_path_relative (str): The path to the script relative to SCRIPTS_DIR.
         case_name (str): The name of the current investigation case.
         script_timeout (int): Timeout in seconds for the script execution.
         *args: Additional arguments to pass to the script.
+        in_process (bool): Prefer calling a Python script's run() in-process.
+        merge_stderr (bool): Send the script's stderr into its stdout pipe, so a
+            single reader relays both streams (stderr lines are logged at INFO).
+        quiet_stderr_scripts (Collection[str]): Scripts (relative to SCRIPTS_DIR)
+            whose stderr is discarded at the pipe level via DEVNULL.
 
     Returns:
         bool: True if the script runs successfully (exit code 0), False otherwise.
     Raises:
         ScriptExecutionError: If the script is not found, times out, or fails.
     """
-    full_script_path = os.path.join(SCRIPTS_DIR, script_path_relative)
-    if not os.path.isfile(full_script_path):
-        msg = f"Target script not found: {full_script_path}"
+    full_script_path = _SCRIPT_TABLE.get(script_path_relative)
+    if full_script_path is None:
+        msg = f"Target script not found: {SCRIPTS_DIR / script_path_relative}"
         logging.error(msg)
         raise ScriptExecutionError(msg)
 
+    if in_process and full_script_path.endswith(".py"):
+        if _defines_run_function(full_script_path):
+            if script_path_relative in quiet_stderr_scripts:
+                stderr_level = None
+            else:
+                stderr_level = logging.INFO if merge_stderr else logging.WARNING
+            return _run_script_in_process(full_script_path, script_path_relative, case_name, script_timeout, args, stderr_level)
+        logging.debug("Script '%s' does not define run(); running it as a subprocess.", script_path_relative)
+
     command = []
     if full_script_path.endswith(".py"):
         command = [sys.executable, full_script_path, case_name] + list(args)
     else:
         command = [full_script_path, case_name] + list(args)
 
-    logging.info(f"Executing script: {' '.join(command)} (Timeout: {script_timeout}s)")
+    logging.info("Executing script: %s (Timeout: %ds)", command, script_timeout)
     try:
-        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, cwd=PROJECT_ROOT)
-        stdout, stderr = process.communicate(timeout=script_timeout)
-
-        if stdout:
-            logging.info(f"Output from '{script_path_relative}' for case '{case_name}':\n{stdout.strip()}")
-        if stderr:
-            if process.returncode != 0:
-                logging.error(f"Error output from '{script_path_relative}' for case '{case_name}' (return code {process.returncode}):\n{stderr.strip()}")
-            else:
-                logging.info(f"Stderr output from '{script_path_relative}' for case '{case_name}':\n{stderr.strip()}")
+        # Let CPython launch the child with posix_spawn() (or vfork) instead of
+        # fork(), which avoids duplicating the orchestrator's page tables.
+        # That fast path requires close_fds=False and no cwd argument; leaking
+        # descriptors is not a concern since Python creates fds non-inheritable
+        # by default (PEP 446). cwd is only passed when it actually differs.
+        spawn_cwd = None if os.getcwd() == str(PROJECT_ROOT) else PROJECT_ROOT
+        if script_path_relative in quiet_stderr_scripts:
+            stderr_target = subprocess.DEVNULL # Discarded by the kernel, never copied to us
+        elif merge_stderr:
+            stderr_target = subprocess.STDOUT # One pipe and one reader thread
+        else:
+            stderr_target = subprocess.PIPE
+        process = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=stderr_target,
+            cwd=spawn_cwd, close_fds=False
+        )
+        # Relay output line by line as it is produced, rather than buffering the
+        # whole output of a long-running script in memory until it exits.
+        output_label = f"[{script_path_relative} | {case_name}]"
+        relay_threads = [
+            threading.Thread(target=_relay_stream, args=(process.stdout, logging.INFO, output_label), daemon=True),
+        ]
+        if process.stderr is not None:
+            # WARNING, not ERROR: healthy scripts write diagnostics to stderr, and
+            # ERROR records would also force a log batch flush for every line.
+            # Failure is reported at ERROR from the return code below.
+            relay_threads.append(
+                threading.Thread(target=_relay_stream, args=(process.stderr, logging.WARNING, output_label), daemon=True)
+            )
+        for relay_thread in relay_threads:
+            relay_thread.start()
+        try:
+            process.wait(timeout=script_timeout)
+        finally:
+            if process.poll() is None:
+                process.kill() # Ensure the process is killed if it times out
+                process.wait()
+            for relay_thread in relay_threads:
+                relay_thread.join()
 
         if process.returncode != 0:
             msg = f"Script '{script_path_relative}' failed for case '{case_name}' with return code {process.returncode}."
             logging.error(msg)
             raise ScriptExecutionError(msg)
 
-        logging.info(f"Script '{script_path_relative}' completed successfully for case '{case_name}'.")
+        logging.info("Script '%s' completed successfully for case '%s'.", script_path_relative, case_name)
         return True
     except FileNotFoundError as e:
         msg = f"Execution error: The script '{full_script_path}' was not found or there's an issue with the Python interpreter/path."
         logging.error(msg)
         raise ScriptExecutionError(msg) from e
     except subprocess.TimeoutExpired as e:
-        process.kill() # Ensure the process is killed if it times out
-        stdout, stderr = process.communicate() # Capture any final output
-        logging.error(f"Timeout ({script_timeout}s) expired for script '{script_path_relative}' for case '{case_name}'. Process killed.")
-        if stdout: logging.info(f"Final stdout before kill:\n{stdout.strip()}")
-        if stderr: logging.error(f"Final stderr before kill:\n{stderr.strip()}")
+        # Any output produced before the kill has already been relayed to the log.
+        logging.error("Timeout (%ds) expired for script '%s' for case '%s'. Process killed.", script_timeout, script_path_relative, case_name)
         raise ScriptExecutionError(f"Script '{script_path_relative}' timed out for case '{case_name}'.") from e
     except Exception as e: # Catch other potential exceptions during subprocess execution
         msg = f"An unexpected error occurred while running '{script_path_relative}' for case '{case_name}': {type(e).__name__} - {e}"
         logging.error(msg)
         raise ScriptExecutionError(msg) from e
 
+def run_scripts_concurrently(scripts_to_run, case_name, script_timeout, max_parallel_scripts, **script_options):
+    """
+    Runs independent scripts in parallel using a thread pool.
+    Each entry in scripts_to_run is a (script_path_relative, script_args) tuple.
+    A thread pool is sufficient here because run_script blocks on the child process.
+    script_options are passed through to run_script as keyword arguments.
+
+    Returns:
+        bool: True if every script succeeded, False if any of them failed.
+    """
+    if not scripts_to_run:
+        return True
+
+    overall_success = True
+    max_workers = max(1, min(max_parallel_scripts, len(scripts_to_run)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(run_script, script_rel_path, case_name, script_timeout, *script_args, **script_options): script_rel_path
+            for script_rel_path, script_args in scripts_to_run
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except ScriptExecutionError: # Error already logged by run_script
+                overall_success = False
+    return overall_success
+
 # --- Workflow Stages ---
 # Each function defines a distinct stage in the investigative workflow.
 # These functions orchestrate calls to the specialized, compartmentalized scripts
@@ -236,25 +905,49 @@ def run_script(script_path_relative, case_name, script_timeout, *args):
 # could be loaded from external configuration files (e.g., YAML) instead of
 # being hardcoded in these stage functions, for greater flexibility.
 
+# Scripts per document/source type for the 'acquire' and 'parse' stages. Scripts
+# for different types are independent of each other and may run concurrently.
+# FUTURE: These mappings could be part of a configurable workflow definition.
+ACQUISITION_SCRIPTS = {
+    'irs_990s': ["scraping/fetch_irs_990_forms.py"],
+    # ... (add other acquisition script mappings)
+}
+
+PARSER_SCRIPTS = {
+    'irs_990s': ["parsers/parse_irs_990xml.py"],
+    # ... (add other parser script mappings)
+}
+
+def _select_scripts(scripts_by_type, selected_type):
+    """
+    Returns the (script_path_relative, script_args) entries for selected_type,
+    or for every type in scripts_by_type when selected_type is 'all' or None.
+    """
+    if selected_type == 'all' or selected_type is None:
+        selected_scripts = [script for scripts in scripts_by_type.values() for script in scripts]
+    else:
+        selected_scripts = scripts_by_type.get(selected_type, [])
+    return [(script_rel_path, []) for script_rel_path in selected_scripts]
+
 def stage_0_setup_investigation(case_name, script_timeout):
     """
     Initial setup for a new investigation case.
     Validates case name, creates base directory and standard subdirectories.
     FUTURE: Could include initializing case-specific config files or pre-flight checks for tools.
     """
-    logging.info(f"--- STAGE 0: SETUP INVESTIGATION for case: {case_name} ---")
+    logging.info("--- STAGE 0: SETUP INVESTIGATION for case: %s ---", case_name)
     try:
         validate_case_name(case_name)
     except InvalidCaseNameError as e:
         logging.error(str(e))
         raise SetupError(str(e)) from e # Re-raise as SetupError
 
-    investigation_path = os.path.join(INVESTIGATIONS_DIR, case_name)
+    investigation_path = INVESTIGATIONS_DIR / case_name
 
     try:
-        logging.info(f"Ensuring base directory exists for investigation '{case_name}': {investigation_path}")
-        os.makedirs(investigation_path, exist_ok=True)
-        logging.info(f"Base directory ensured: {investigation_path}")
+        logging.info("Ensuring base directory exists for investigation '%s': %s", case_name, investigation_path)
+        investigation_path.mkdir(parents=True, exist_ok=True)
+        logging.info("Base directory ensured: %s", investigation_path)
 
         # Create standard sub-directory structure
         # FUTURE: This list could be made configurable.
@@ -272,54 +965,44 @@ def stage_0_setup_investigation(case_name, script_timeout):
             "04_findings_and_narrative"
         ]
         for sub_dir_path_relative in standard_subdirs:
-            # Handle potential nested subdirs in the path
-            full_sub_dir_path = investigation_path
-            for part in sub_dir_path_relative.split('/'):
-                full_sub_dir_path = os.path.join(full_sub_dir_path, part)
-            os.makedirs(full_sub_dir_path, exist_ok=True)
-        logging.info(f"Standard subdirectories ensured within '{case_name}'.")
+            # Path.mkdir only walks up to create parents when the first mkdir
+            # fails, so leaves under existing parents cost a single syscall.
+            (investigation_path / sub_dir_path_relative).mkdir(parents=True, exist_ok=True)
+        logging.info("Standard subdirectories ensured within '%s'.", case_name)
 
     except OSError as e:
         msg = f"Failed to create directories for case '{case_name}': {e}"
         logging.error(msg)
         raise SetupError(msg) from e
+    finally:
+        _investigation_exists.cache_clear() # Directories may have been created above
 
     # Placeholder for pre-flight checks or initializing case-specific config
     # e.g., run_script("utils/initialize_case_config.py", case_name, script_timeout)
     # e.g., run_script("utils/perform_preflight_checks.py", case_name, script_timeout)
 
-    logging.info(f"Stage 0: Setup investigation for '{case_name}' completed.")
+    logging.info("Stage 0: Setup investigation for '%s' completed.", case_name)
     return True
 
 
-def stage_1_acquire_source_documents(case_name, source_type, script_timeout):
+def stage_1_acquire_source_documents(case_name, source_type, script_timeout, max_parallel_scripts=DEFAULT_MAX_PARALLEL_SCRIPTS, **script_options):
     """Orchestrates scripts for acquiring source documents."""
-    logging.info(f"--- STAGE 1: ACQUIRE SOURCE DOCUMENTS for case: {case_name} (Type: {source_type or 'all'}) ---")
+    logging.info("--- STAGE 1: ACQUIRE SOURCE DOCUMENTS for case: %s (Type: %s) ---", case_name, source_type or 'all')
     if not validate_investigation_exists(case_name):
         raise StageError(f"Cannot run 'acquire' stage: Investigation directory for '{case_name}' not found or invalid.")
 
-    overall_stage_success = True
-    scripts_to_run = []
-    # FUTURE: This mapping could be part of a configurable workflow definition.
-    if source_type == 'irs_990s' or source_type == 'all' or source_type is None:
-        scripts_to_run.append("scraping/fetch_irs_990_forms.py")
-    # ... (add other acquisition script mappings)
+    # With no specific type, every source type is fetched in the same parallel batch.
+    scripts_to_run = _select_scripts(ACQUISITION_SCRIPTS, source_type)
 
     if not scripts_to_run:
-        logging.warning(f"No acquisition scripts for source_type '{source_type}'. Stage may be incomplete.")
+        logging.warning("No acquisition scripts for source_type '%s'. Stage may be incomplete.", source_type)
         return True # Not a failure if no scripts match the specific type
 
-    for script_rel_path in scripts_to_run:
-        try:
-            run_script(script_rel_path, case_name, script_timeout)
-        except ScriptExecutionError: # Specific error from run_script
-            overall_stage_success = False
-            # Error already logged by run_script
-    return overall_stage_success
+    return run_scripts_concurrently(scripts_to_run, case_name, script_timeout, max_parallel_scripts, **script_options)
 
-def stage_2_datashare_processing(case_name, action, script_timeout):
+def stage_2_datashare_processing(case_name, action, script_timeout, **script_options):
     """Manages interactions with a Datashare instance."""
-    logging.info(f"--- STAGE 2: DATASHARE PROCESSING for case: {case_name} (Action: {action or 'all'}) ---")
+    logging.info("--- STAGE 2: DATASHARE PROCESSING for case: %s (Action: %s) ---", case_name, action or 'all')
     if not validate_investigation_exists(case_name):
         raise StageError(f"Cannot run 'datashare' stage: Investigation directory for '{case_name}' not found or invalid.")
 
@@ -330,63 +1013,51 @@ def stage_2_datashare_processing(case_name, action, script_timeout):
     # ... (add other datashare action mappings)
 
     if not actions_to_perform:
-        logging.warning(f"No Datashare actions for type '{action}'. Stage may be incomplete.")
+        logging.warning("No Datashare actions for type '%s'. Stage may be incomplete.", action)
         return True
 
     for script_rel_path, script_args in actions_to_perform:
         try:
-            run_script(script_rel_path, case_name, script_timeout, *script_args)
+            run_script(script_rel_path, case_name, script_timeout, *script_args, **script_options)
         except ScriptExecutionError:
             overall_stage_success = False
     return overall_stage_success
 
-def stage_3_parse_and_structure_data(case_name, document_type, script_timeout):
+def stage_3_parse_and_structure_data(case_name, document_type, script_timeout, max_parallel_scripts=DEFAULT_MAX_PARALLEL_SCRIPTS, **script_options):
     """Executes parsing scripts to extract structured data."""
-    logging.info(f"--- STAGE 3: PARSE AND STRUCTURE DATA for case: {case_name} (Type: {document_type or 'all'}) ---")
+    logging.info("--- STAGE 3: PARSE AND STRUCTURE DATA for case: %s (Type: %s) ---", case_name, document_type or 'all')
     if not validate_investigation_exists(case_name):
         raise StageError(f"Cannot run 'parse' stage: Investigation directory for '{case_name}' not found or invalid.")
 
-    overall_stage_success = True
-    scripts_to_run = []
-    if document_type == 'irs_990s' or document_type == 'all' or document_type is None:
-        scripts_to_run.append("parsers/parse_irs_990xml.py")
-    # ... (add other parser script mappings)
+    scripts_to_run = _select_scripts(PARSER_SCRIPTS, document_type)
 
-    for script_rel_path in scripts_to_run:
-        try:
-            run_script(script_rel_path, case_name, script_timeout)
-        except ScriptExecutionError:
-            overall_stage_success = False
+    # Parsers are independent of each other; this call returns only once all of them
+    # have finished, which acts as the barrier before entity resolution.
+    overall_stage_success = run_scripts_concurrently(scripts_to_run, case_name, script_timeout, max_parallel_scripts, **script_options)
 
     if document_type == 'all' or document_type is None: # Entity resolution after parsing
         try:
-            run_script("analysis/entity_resolution.py", case_name, script_timeout)
+            run_script("analysis/entity_resolution.py", case_name, script_timeout, **script_options)
         except ScriptExecutionError:
             overall_stage_success = False
     return overall_stage_success
 
-def stage_4_analysis_and_reporting(case_name, report_type, script_timeout):
+def stage_4_analysis_and_reporting(case_name, report_type, script_timeout, max_parallel_scripts=DEFAULT_MAX_PARALLEL_SCRIPTS, **script_options):
     """Runs analysis scripts and generates reports."""
-    logging.info(f"--- STAGE 4: ANALYSIS AND REPORTING for case: {case_name} (Report: {report_type or 'all'}) ---")
+    logging.info("--- STAGE 4: ANALYSIS AND REPORTING for case: %s (Report: %s) ---", case_name, report_type or 'all')
     if not validate_investigation_exists(case_name):
         raise StageError(f"Cannot run 'analyze' stage: Investigation directory for '{case_name}' not found or invalid.")
 
-    overall_stage_success = True
     scripts_to_run = []
     if report_type == 'connections' or report_type == 'all' or report_type is None:
-        scripts_to_run.append("analysis/generate_connections_report.py")
+        scripts_to_run.append(("analysis/generate_connections_report.py", []))
     # ... (add other analysis script mappings)
 
-    for script_rel_path in scripts_to_run:
-        try:
-            run_script(script_rel_path, case_name, script_timeout)
-        except ScriptExecutionError:
-            overall_stage_success = False
-    return overall_stage_success
+    return run_scripts_concurrently(scripts_to_run, case_name, script_timeout, max_parallel_scripts, **script_options)
 
 def stage_5_package_for_review(case_name, script_timeout):
     """Placeholder for final stage tasks."""
-    logging.info(f"--- STAGE 5: PACKAGE FOR REVIEW for case: {case_name} ---")
+    logging.info("--- STAGE 5: PACKAGE FOR REVIEW for case: %s ---", case_name)
     if not validate_investigation_exists(case_name):
         raise StageError(f"Cannot run 'package' stage: Investigation directory for '{case_name}' not found or invalid.")
     # Example:
@@ -394,10 +1065,29 @@ def stage_5_package_for_review(case_name, script_timeout):
     #     run_script("utils/package_case_findings.py", case_name, script_timeout)
     # except ScriptExecutionError:
     #     return False
-    logging.info(f"Stage 5: Package for review for '{case_name}' completed (placeholder).")
+    logging.info("Stage 5: Package for review for '%s' completed (placeholder).", case_name)
     return True
 
 
+# Maps each stage name to a callable taking (case_name, args, script_options),
+# where args is the parsed command line. Each entry picks out the options its
+# stage needs. Stages are listed in the order 'all' runs them.
+STAGE_FUNCS = {
+    'setup': lambda case_name, args, script_options: stage_0_setup_investigation(
+        case_name, args.script_timeout),
+    'acquire': lambda case_name, args, script_options: stage_1_acquire_source_documents(
+        case_name, args.acquire_type, args.script_timeout, args.max_parallel_scripts, **script_options),
+    'datashare': lambda case_name, args, script_options: stage_2_datashare_processing(
+        case_name, args.datashare_action, args.script_timeout, **script_options),
+    'parse': lambda case_name, args, script_options: stage_3_parse_and_structure_data(
+        case_name, args.parse_type, args.script_timeout, args.max_parallel_scripts, **script_options),
+    'analyze': lambda case_name, args, script_options: stage_4_analysis_and_reporting(
+        case_name, args.report_type, args.script_timeout, args.max_parallel_scripts, **script_options),
+    'package': lambda case_name, args, script_options: stage_5_package_for_review(
+        case_name, args.script_timeout),
+}
+
+
 # --- Main Execution Logic ---
 def main():
     """Main function to parse command-line arguments and orchestrate the workflow stages."""
@@ -412,7 +1102,7 @@ def main():
     )
     parser.add_argument(
         "--stage", action="append",
-        choices=['setup', 'acquire', 'datashare', 'parse', 'analyze', 'package', 'all'],
+        choices=list(STAGE_FUNCS) + ['all'],
         required=True,
         help="Which stage(s) of the workflow to run. Specify multiple times for multiple stages\n"
              "(e.g., --stage acquire --stage parse). 'all' runs all defined stages sequentially."
@@ -421,6 +1111,30 @@ def main():
         "--script-timeout", type=int, default=DEFAULT_SCRIPT_TIMEOUT,
         help=f"Global timeout in seconds for individual scripts called by the orchestrator (default: {DEFAULT_SCRIPT_TIMEOUT}s)."
     )
+    parser.add_argument(
+        "--max-parallel-scripts", type=int, default=DEFAULT_MAX_PARALLEL_SCRIPTS,
+        help=f"Maximum number of independent scripts run concurrently within a stage (default: {DEFAULT_MAX_PARALLEL_SCRIPTS})."
+    )
+    parser.add_argument(
+        "--in-process-scripts", action="store_true",
+        help="Import Python scripts that define 'run(case_name, *args)' and call it directly\n"
+             "instead of starting a new interpreter for each script."
+    )
+    parser.add_argument(
+        "--no-merge-stderr", dest="merge_stderr", action="store_false",
+        help="Capture each script's stderr on its own pipe and log it at WARNING level,\n"
+             "instead of merging it into stdout (default: merged)."
+    )
+    parser.add_argument(
+        "--quiet-stderr", action="append", metavar="SCRIPT",
+        help="Discard stderr of the given script (path relative to './scripts/').\n"
+             "Specify multiple times for multiple scripts."
+    )
+    parser.add_argument(
+        "--io-uring-logging", action="store_true",
+        help="Write the log file through io_uring (Linux only, requires the 'liburing' package).\n"
+             "Falls back to regular buffered file logging if unavailable."
+    )
     # Optional arguments for stages
     parser.add_argument("--acquire-type", choices=['irs_990s', 'corporate', 'campaign', 'lobbying', 'property', 'all', None], default=None, help="For 'acquire' stage: specific document type (default: all).")
     parser.add_argument("--datashare-action", choices=['create_project', 'upload', 'query_entities', 'all', None], default=None, help="For 'datashare' stage: specific action (default: all).")
@@ -428,79 +1142,84 @@ def main():
     parser.add_argument("--report-type", choices=['connections', 'network_graph', 'financial_patterns', 'all', None], default=None, help="For 'analyze' stage: specific report type (default: all).")
 
     args = parser.parse_args()
+    if args.io_uring_logging and _enable_io_uring_logging():
+        logging.info("Log file writes are submitted through io_uring.")
     case_name = args.case_name
     stages_to_run_input = args.stage
     script_timeout = args.script_timeout
-
-    logging.info(f"================================================================================")
-    logging.info(f"Initializing workflow for investigation case: '{case_name}'")
-    logging.info(f"Requested stage(s): {', '.join(stages_to_run_input)}")
-    logging.info(f"Global script timeout set to: {script_timeout} seconds")
-    logging.info(f"================================================================================")
+    max_parallel_scripts = args.max_parallel_scripts
+    script_options = {
+        "in_process": args.in_process_scripts,
+        "merge_stderr": args.merge_stderr,
+        "quiet_stderr_scripts": frozenset(args.quiet_stderr or ()),
+    }
+
+    logging.info("================================================================================")
+    logging.info("Initializing workflow for investigation case: '%s'", case_name)
+    logging.info("Requested stage(s): %s", ', '.join(stages_to_run_input))
+    logging.info("Global script timeout set to: %d seconds", script_timeout)
+    logging.info("Maximum parallel scripts per stage: %d", max_parallel_scripts)
+    if script_options["in_process"]:
+        logging.info("In-process execution enabled for Python scripts that define run().")
+    if not script_options["merge_stderr"]:
+        logging.info("Script stderr will be captured separately from stdout.")
+    if script_options["quiet_stderr_scripts"]:
+        logging.info("Discarding stderr for script(s): %s", ', '.join(sorted(script_options['quiet_stderr_scripts'])))
+    logging.info("================================================================================")
 
     try:
         validate_case_name(case_name) # Initial validation of case_name format
     except InvalidCaseNameError as e:
-        logging.error(f"Workflow halted due to invalid case name: {e}")
+        logging.error("Workflow halted due to invalid case name: %s", e)
         sys.exit(1)
 
 
     if 'all' in stages_to_run_input:
-        stages_to_run_ordered = ['setup', 'acquire', 'datashare', 'parse', 'analyze', 'package']
+        stages_to_run_ordered = list(STAGE_FUNCS)
         logging.info("Processing 'all' stages in predefined order.")
     else:
         stages_to_run_ordered = stages_to_run_input
 
     overall_workflow_success = True
     for stage_name in stages_to_run_ordered:
-        current_stage_success = False
+        # Checked before any dispatch work so a failure cascade only logs skips.
+        if not overall_workflow_success and stage_name != 'setup':
+            logging.warning("Skipping stage '%s' for case '%s' due to failure in a preceding stage.", stage_name, case_name)
+            continue
+
         try:
-            if not overall_workflow_success and stage_name not in ['setup']:
-                logging.warning(f"Skipping stage '{stage_name}' for case '{case_name}' due to failure in a preceding stage.")
-                continue
+            logging.info("--- Starting Stage: %s for case '%s' ---", stage_name.upper(), case_name)
 
-            logging.info(f"--- Starting Stage: {stage_name.upper()} for case '{case_name}' ---")
-
-            if stage_name == 'setup':
-                current_stage_success = stage_0_setup_investigation(case_name, script_timeout)
-            elif stage_name == 'acquire':
-                current_stage_success = stage_1_acquire_source_documents(case_name, args.acquire_type, script_timeout)
-            elif stage_name == 'datashare':
-                current_stage_success = stage_2_datashare_processing(case_name, args.datashare_action, script_timeout)
-            elif stage_name == 'parse':
-                current_stage_success = stage_3_parse_and_structure_data(case_name, args.parse_type, script_timeout)
-            elif stage_name == 'analyze':
-                current_stage_success = stage_4_analysis_and_reporting(case_name, args.report_type, script_timeout)
-            elif stage_name == 'package':
-                current_stage_success = stage_5_package_for_review(case_name, script_timeout)
-            else:
-                logging.error(f"Encountered an unknown stage: '{stage_name}'.")
+            stage_func = STAGE_FUNCS.get(stage_name)
+            if stage_func is None:
+                logging.error("Encountered an unknown stage: '%s'.", stage_name)
                 # This should not happen if argparse choices are correct
                 raise OrchestratorError(f"Unknown stage definition: {stage_name}")
+            current_stage_success = stage_func(case_name, args, script_options)
 
             if not current_stage_success: # If a stage function returns False explicitly
                 raise StageError(f"Stage '{stage_name}' reported failure for case '{case_name}'.")
 
-            logging.info(f"--- Stage: {stage_name.upper()} for case '{case_name}' COMPLETED successfully ---")
+            logging.info("--- Stage: %s for case '%s' COMPLETED successfully ---", stage_name.upper(), case_name)
 
         except (OrchestratorError, SetupError, StageError, ScriptExecutionError) as e: # Catch our custom errors
-            logging.error(f"!!! Stage '{stage_name}' FAILED for case '{case_name}' with error: {type(e).__name__} - {e} !!!")
+            logging.error("!!! Stage '%s' FAILED for case '%s' with error: %s - %s !!!", stage_name, case_name, type(e).__name__, e)
             overall_workflow_success = False
             # Depending on severity, might want to break or offer options to continue non-dependent stages.
             # For now, we mark overall failure and continue to log other requested stages as skipped.
         except Exception as e: # Catch any other unexpected errors
-            logging.critical(f"!!! UNEXPECTED CRITICAL ERROR during stage '{stage_name}' for case '{case_name}': {type(e).__name__} - {e} !!!", exc_info=True)
+            logging.critical("!!! UNEXPECTED CRITICAL ERROR during stage '%s' for case '%s': %s - %s !!!", stage_name, case_name, type(e).__name__, e, exc_info=True)
             overall_workflow_success = False
             # For truly unexpected errors, it's often best to halt.
 
-    logging.info(f"================================================================================")
+    logging.info("================================================================================")
     if overall_workflow_success:
-        logging.info(f"Workflow for investigation case '{case_name}' concluded successfully.")
+        logging.info("Workflow for investigation case '%s' concluded successfully.", case_name)
     else:
-        logging.error(f"Workflow for investigation case '{case_name}' concluded with one or more FAILED stages.")
-        logging.error("Please review the log file for detailed error messages: " + LOG_FILE)
+        logging.error("Workflow for investigation case '%s' concluded with one or more FAILED stages.", case_name)
+        logging.error("Please review the log file for detailed error messages: %s", LOG_FILE)
         sys.exit(1)
-    logging.info(f"================================================================================")
+    logging.info("================================================================================")
 
 if __name__ == "__main__":
     main()